@@ -1,5 +1,6 @@
 import random
 import time
+from pathlib import Path
 
 import pandas as pd
 import streamlit as st
@@ -29,76 +30,23 @@ st.set_page_config(
     page_icon="🤖",
 )
 
-st.markdown(
-    """
-    <style>
-    .main-title {
-        font-size: 2.6rem;
-        font-weight: 800;
-        text-align: center;
-        margin-bottom: 0.2rem;
-    }
-    .subtitle {
-        text-align: center;
-        font-size: 1.0rem;
-        color: #555;
-        margin-bottom: 1.2rem;
-    }
-    .chat-bubble-bot {
-        background: #ecf5ff;
-        border-radius: 16px;
-        padding: 0.8rem 1rem;
-        margin-bottom: 0.4rem;
-        border: 1px solid #c9ddff;
-        font-size: 0.98rem;
-    }
-    .chat-bubble-human {
-        background: #fff7e6;
-        border-radius: 16px;
-        padding: 0.8rem 1rem;
-        margin-bottom: 0.4rem;
-        border: 1px solid #ffe0b3;
-        font-size: 0.98rem;
-    }
-    .review-card {
-        background: linear-gradient(135deg, #fdfbfb 0%, #ebedee 100%);
-        border-radius: 14px;
-        padding: 1.4rem 1.6rem;
-        border: 1px solid #e0e0e0;
-        box-shadow: 0 6px 16px rgba(0,0,0,0.06);
-        font-size: 1.02rem;
-        margin-top: 0.4rem;
-        margin-bottom: 0.6rem;
-    }
-    .result-card {
-        border-radius: 14px;
-        padding: 1.2rem 1.4rem;
-        background-color: #ffffff;
-        border: 1px solid #e8e8e8;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.04);
-    }
-    .winner-text {
-        font-size: 1.5rem;
-        font-weight: 750;
-        text-align: center;
-    }
-    @keyframes nod {
-        0%   {transform: translateY(0) rotate(0deg);}
-        25%  {transform: translateY(-4px) rotate(-5deg);}
-        50%  {transform: translateY(0) rotate(0deg);}
-        75%  {transform: translateY(-4px) rotate(5deg);}
-        100% {transform: translateY(0) rotate(0deg);}
-    }
-    .nodding-bot {
-        font-size: 3rem;
-        display: inline-block;
-        animation: nod 1.2s infinite;
-        margin-bottom: 0.3rem;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# Styles live in style.css next to this script.
+CSS_PATH = Path(__file__).with_name("style.css")
+
+try:
+    st.markdown(
+        f"<style>{CSS_PATH.read_text(encoding='utf-8')}</style>",
+        unsafe_allow_html=True,
+    )
+except OSError as e:
+    st.error(
+        f"Could not load {CSS_PATH.name} (it must sit next to "
+        f"{Path(__file__).name}): {e}. The game still works, just without styling."
+    )
+
+# Chat-bubble templates; only the message body changes per call.
+BOT_BUBBLE = "<div class='chat-bubble-bot'>🤖 <b>AI Guess Bot:</b> {}</div>"
+HUMAN_BUBBLE = "<div class='chat-bubble-human'>🧑 <b>You:</b> {}</div>"
 
 # ================== HELPER FUNCTIONS ================== #
 
@@ -199,10 +147,10 @@ if "phase" not in st.session_state:
 
 if st.session_state.phase == "intro":
     st.markdown(
-        "<div class='chat-bubble-bot'>"
-        "🤖 <b>AI Guess Bot:</b> Hey! I'm the <b>AI Guess Bot</b>, and I'm happy to see you here 😊<br>"
-        "Are you ready to start the game?"
-        "</div>",
+        BOT_BUBBLE.format(
+            "Hey! I'm the <b>AI Guess Bot</b>, and I'm happy to see you here 😊<br>"
+            "Are you ready to start the game?"
+        ),
         unsafe_allow_html=True,
     )
 
@@ -213,21 +161,21 @@ if st.session_state.phase == "intro":
 
     if ready_option == "Yes, let's start!":
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> Awesome! Let's get things ready 🎉<br>"
-            "First, I need your reviews dataset so I can start asking questions."
-            "</div>",
+            BOT_BUBBLE.format(
+                "Awesome! Let's get things ready 🎉<br>"
+                "First, I need your reviews dataset so I can start asking questions."
+            ),
             unsafe_allow_html=True,
-    )
+        )
         st.session_state.phase = "upload"
         st.rerun()
 
     elif ready_option == "No, not yet":
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> No worries! I'll be nodding here until you're ready 😄<br>"
-            "Just pick <b>Yes, let's start!</b> when you're ready to play."
-            "</div>",
+            BOT_BUBBLE.format(
+                "No worries! I'll be nodding here until you're ready 😄<br>"
+                "Just pick <b>Yes, let's start!</b> when you're ready to play."
+            ),
             unsafe_allow_html=True,
         )
 
@@ -237,10 +185,10 @@ if st.session_state.phase == "intro":
 
 if st.session_state.phase == "upload":
     st.markdown(
-        "<div class='chat-bubble-bot'>"
-        "🤖 <b>AI Guess Bot:</b> Can you upload the <b>reviews dataset</b> to start the game?<br>"
-        "I need a CSV file with columns <code>review</code> and <code>sentiment</code>."
-        "</div>",
+        BOT_BUBBLE.format(
+            "Can you upload the <b>reviews dataset</b> to start the game?<br>"
+            "I need a CSV file with columns <code>review</code> and <code>sentiment</code>."
+        ),
         unsafe_allow_html=True,
     )
 
@@ -250,9 +198,7 @@ if st.session_state.phase == "upload":
     )
 
     st.markdown(
-        "<div class='chat-bubble-bot'>"
-        "🤖 <b>AI Guess Bot:</b> And how many questions do you want me to ask you?"
-        "</div>",
+        BOT_BUBBLE.format("And how many questions do you want me to ask you?"),
         unsafe_allow_html=True,
     )
 
@@ -269,10 +215,10 @@ if st.session_state.phase == "upload":
     if start:
         if uploaded_file is None:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                "🤖 <b>AI Guess Bot:</b> Oops! I can't see any file yet 😅<br>"
-                "Please upload a CSV so I can read the reviews."
-                "</div>",
+                BOT_BUBBLE.format(
+                    "Oops! I can't see any file yet 😅<br>"
+                    "Please upload a CSV so I can read the reviews."
+                ),
                 unsafe_allow_html=True,
             )
             st.stop()
@@ -280,22 +226,22 @@ if st.session_state.phase == "upload":
             df = pd.read_csv(uploaded_file)
         except Exception as e:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                f"🤖 <b>AI Guess Bot:</b> I tried to read the file but got an error: "
-                f"<code>{e}</code><br>"
-                "Can you check the file and try again?"
-                "</div>",
+                BOT_BUBBLE.format(
+                    f"I tried to read the file but got an error: "
+                    f"<code>{e}</code><br>"
+                    "Can you check the file and try again?"
+                ),
                 unsafe_allow_html=True,
             )
             st.stop()
 
         if "review" not in df.columns or "sentiment" not in df.columns:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                "🤖 <b>AI Guess Bot:</b> Hmmm... your file is missing "
-                "<code>review</code> and/or <code>sentiment</code> columns 😢<br>"
-                "Please fix it and upload again."
-                "</div>",
+                BOT_BUBBLE.format(
+                    "Hmmm... your file is missing "
+                    "<code>review</code> and/or <code>sentiment</code> columns 😢<br>"
+                    "Please fix it and upload again."
+                ),
                 unsafe_allow_html=True,
             )
             st.stop()
@@ -303,20 +249,20 @@ if st.session_state.phase == "upload":
         df = df.dropna(subset=["review", "sentiment"])
         if df.empty:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                "🤖 <b>AI Guess Bot:</b> After cleaning, I found no valid rows. "
-                "Please try another dataset."
-                "</div>",
+                BOT_BUBBLE.format(
+                    "After cleaning, I found no valid rows. "
+                    "Please try another dataset."
+                ),
                 unsafe_allow_html=True,
             )
             st.stop()
 
         # Bot nods that we're ready
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> Nice! Your dataset looks good. "
-            "We are <b>ready to start the game</b> now! 🚀"
-            "</div>",
+            BOT_BUBBLE.format(
+                "Nice! Your dataset looks good. "
+                "We are <b>ready to start the game</b> now! 🚀"
+            ),
             unsafe_allow_html=True,
         )
 
@@ -410,11 +356,11 @@ if not st.session_state.game_over:
         "Is this review happy, meh, or mad? You tell me 😄",
     ]
     st.markdown(
-        "<div class='chat-bubble-bot'>"
-        f"🤖 <b>AI Guess Bot:</b> Round <b>{st.session_state.round}</b>! "
-        f"{random.choice(fun_round_lines)}<br>"
-        "Read this review carefully 👇"
-        "</div>",
+        BOT_BUBBLE.format(
+            f"Round <b>{st.session_state.round}</b>! "
+            f"{random.choice(fun_round_lines)}<br>"
+            "Read this review carefully 👇"
+        ),
         unsafe_allow_html=True,
     )
 
@@ -426,10 +372,10 @@ if not st.session_state.game_over:
     # Let user answer
     if not st.session_state.show_result and not st.session_state.time_up:
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> What do you think this review feels like? "
-            "Choose one option:"
-            "</div>",
+            BOT_BUBBLE.format(
+                "What do you think this review feels like? "
+                "Choose one option:"
+            ),
             unsafe_allow_html=True,
         )
 
@@ -521,10 +467,10 @@ if not st.session_state.game_over:
         # Bot reaction
         if human == truth:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                "🤖 <b>AI Guess Bot:</b> Hurray! You are right on track! 😄🔥 "
-                "That was a great call!"
-                "</div>",
+                BOT_BUBBLE.format(
+                    "Hurray! You are right on track! 😄🔥 "
+                    "That was a great call!"
+                ),
                 unsafe_allow_html=True,
             )
             st.image(
@@ -534,11 +480,11 @@ if not st.session_state.game_over:
             )
         else:
             st.markdown(
-                "<div class='chat-bubble-bot'>"
-                "🤖 <b>AI Guess Bot:</b> Aww, not this time 😢 "
-                "Either you missed it or the timer got you. "
-                "But don't worry, the next one is yours!"
-                "</div>",
+                BOT_BUBBLE.format(
+                    "Aww, not this time 😢 "
+                    "Either you missed it or the timer got you. "
+                    "But don't worry, the next one is yours!"
+                ),
                 unsafe_allow_html=True,
             )
             st.image(
@@ -587,9 +533,7 @@ if st.session_state.game_over:
     # 🎉 Winner dance GIFs reusing working pools
     if human > ai_score:
         st.markdown(
-            "<div class='chat-bubble-human'>"
-            "🧑 <b>You:</b> Time for my victory dance! 🕺🎉"
-            "</div>",
+            HUMAN_BUBBLE.format("Time for my victory dance! 🕺🎉"),
             unsafe_allow_html=True,
         )
         st.image(
@@ -599,9 +543,7 @@ if st.session_state.game_over:
         )
     elif human < ai_score:
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> I won! Let me show you my dance moves! 💃✨"
-            "</div>",
+            BOT_BUBBLE.format("I won! Let me show you my dance moves! 💃✨"),
             unsafe_allow_html=True,
         )
         st.image(
@@ -611,9 +553,7 @@ if st.session_state.game_over:
         )
     else:
         st.markdown(
-            "<div class='chat-bubble-bot'>"
-            "🤖 <b>AI Guess Bot:</b> It's a tie! Let's both dance together 😄"
-            "</div>",
+            BOT_BUBBLE.format("It's a tie! Let's both dance together 😄"),
             unsafe_allow_html=True,
         )
         st.image(